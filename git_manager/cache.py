@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru_logger import logging
+
+
+def default_cache_path() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "git-manager" / "cache.json"
+
+
+class DiskCache:
+    """
+    JSON file cache for git query results that persists between runs.
+
+    Each entry is stored per (repository path, operation) together with a fingerprint,
+    such as the repository's HEAD sha. A lookup with a different fingerprint is a miss,
+    and the next write replaces the stale entry, so the file stays bounded by the
+    number of repositories.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @staticmethod
+    def _key(repo_path: str, operation: str) -> str:
+        return json.dumps([repo_path, operation])
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        if self._data is None:
+            try:
+                data = json.loads(self.path.read_text())
+                self._data = data if isinstance(data, dict) else {}
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable cache file {self.path}: {e}")
+                self._data = {}
+        return self._data
+
+    def get(self, repo_path: str, operation: str, fingerprint: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._load().get(self._key(repo_path, operation))
+        if not isinstance(entry, dict) or entry.get("fingerprint") != fingerprint:
+            return None
+        return entry.get("value")
+
+    def set(self, repo_path: str, operation: str, fingerprint: str, value: Any) -> None:
+        with self._lock:
+            data = self._load()
+            data[self._key(repo_path, operation)] = {"fingerprint": fingerprint, "value": value}
+            tmp_path = None
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w") as tmp_file:
+                    json.dump(data, tmp_file)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                if tmp_path:
+                    Path(tmp_path).unlink(missing_ok=True)
+                logging.warning(f"Failed to write cache file {self.path}: {e}")
@@ -16,6 +16,8 @@ logger.add(
 # )
 
 logging = logger
+# Arguments are callables evaluated only if the record is emitted, for hot-path debug logs.
+lazy_logging = logger.opt(lazy=True)
 
 if __name__ == "__main__":
     logging.info("This is an info message")
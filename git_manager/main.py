@@ -1,19 +1,30 @@
 import argparse
+import hashlib
 import os
 import re
 import shutil
 import subprocess
 import sys
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, Final, List, Optional, Set, TypeAlias
+from typing import Dict, Final, Iterable, Iterator, List, Optional, Tuple, TypeAlias
 
 import requests
+from cache import DiskCache, default_cache_path
 from git import Repo
-from loguru_logger import logging
+from loguru_logger import lazy_logging, logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 BranchName: TypeAlias = str
 UnixTimestamp: TypeAlias = int
@@ -26,10 +37,47 @@ class Config:
     DEFAULT_BACKUP_COMMIT_MESSAGE: Final[str] = "pruner: auto backup"
     HEAD_BRANCH_KEYWORD: Final[str] = "HEAD branch"
     GIT_TIMEOUT: Final[int] = 30
+    MAX_WORKERS: Final[int] = 8
+    # Blobless partial clone: history and trees come down, file contents only on checkout,
+    # so prune's checkout of the default branch may hit the network.
+    CLONE_GIT_FLAGS: Final[Tuple[str, ...]] = ("--filter=blob:none",)
+    # Abort a fetch whose transfer stays below LIMIT bytes/s for TIME seconds.
+    FETCH_LOW_SPEED_LIMIT: Final[int] = 1000
+    FETCH_LOW_SPEED_TIME: Final[int] = 60
+    GROUP_REPOSITORIES_CACHE_TTL: Final[int] = 60
+    GROUP_REPOSITORIES_CACHE_SIZE: Final[int] = 32
 
 
 config = Config()
 
+_CLONING_INTO_RE: Final[re.Pattern[str]] = re.compile(r"Cloning into '([^']+)'")
+_QUOTED_RE: Final[re.Pattern[str]] = re.compile(r"'([^']+)'")
+
+# Ordered (needle, kind) pairs used to classify glab/git clone output; first match wins.
+_CLONE_LINE_KINDS: Final[Tuple[Tuple[str, str], ...]] = (
+    ("Cloning into", "clone"),
+    ("already exists and is not an empty directory", "skip"),
+    ('Error: "exit status 128"', "status"),
+    ("remote:", "progress"),
+    ("Receiving objects:", "progress"),
+    ("Resolving deltas:", "progress"),
+)
+
+disk_cache = DiskCache(default_cache_path())
+# (host, group id, token sha256) -> (monotonic fetch time, {path_with_namespace: http_url})
+_group_repositories_cache: Dict[Tuple[str, str, str], Tuple[float, Dict[str, str]]] = {}
+
+# Built once at import; run_command only copies it for a non-default timeout.
+# LC_ALL=C keeps the git messages we parse ("Deleted branch", "HEAD branch:") in English,
+# and GIT_OPTIONAL_LOCKS=0 stops parallel `git status` calls contending for index.lock.
+_GIT_ENV: Final[Dict[str, str]] = {
+    **os.environ,
+    "GIT_HTTP_CONNECT_TIMEOUT": str(config.GIT_TIMEOUT),
+    "GIT_TERMINAL_PROMPT": "0",
+    "GIT_OPTIONAL_LOCKS": "0",
+    "LC_ALL": "C",
+}
+
 
 class GitLabAPIError(Exception):
     pass
@@ -42,7 +90,7 @@ def run_command(
     text: bool = True,
     shell: bool = False,
     capture_output: bool = True,
-    timeout: int = config.GIT_TIMEOUT,
+    timeout: Optional[int] = config.GIT_TIMEOUT,
 ) -> subprocess.CompletedProcess:
     """
     Execute a command in a subprocess with proper error logging.
@@ -56,7 +104,9 @@ def run_command(
         text: Return output as text.
         shell: Execute command through shell.
         capture_output: Capture stdout and stderr.
-        timeout: Command timeout in seconds.
+        timeout: Command timeout in seconds. The default suits read-only queries;
+            pass None for commands that modify the repository, since a killed git
+            can leave a half-written working tree and a stale index.lock behind.
 
     Returns:
         A subprocess.CompletedProcess instance.
@@ -67,8 +117,9 @@ def run_command(
         OSError: For OS-related errors.
     """
     try:
-        env = os.environ.copy()
-        env["GIT_HTTP_CONNECT_TIMEOUT"] = str(timeout)
+        env = _GIT_ENV
+        if timeout is not None and timeout != config.GIT_TIMEOUT:
+            env = {**_GIT_ENV, "GIT_HTTP_CONNECT_TIMEOUT": str(timeout)}
 
         if shell and isinstance(cmd, list):
             cmd = " ".join(cmd)
@@ -96,35 +147,139 @@ def run_command(
         raise
 
 
-def remove_directory(directory: Path):
+@lru_cache(maxsize=1024)
+def _default_branch_for(repo_path: str, remote: str) -> str | None:
+    """
+    Default branch of `remote` for the repository at `repo_path`.
+
+    Memoized per process; the networked `git remote show` fallback is also cached on disk
+    keyed by the repository HEAD.
+    """
+    output = run_command(
+        ["git", "symbolic-ref", "--short", "-q", f"refs/remotes/{remote}/HEAD"],
+        path=Path(repo_path),
+        check=False,
+    )
+    if output.returncode == 0 and output.stdout.strip():
+        return output.stdout.strip().removeprefix(f"{remote}/")
+
+    head = run_command(
+        ["git", "rev-parse", "-q", "--verify", "HEAD"], path=Path(repo_path), check=False
+    ).stdout.strip()
+    cache_operation = f"default_branch:{remote}"
+    if head:
+        cached = disk_cache.get(repo_path, cache_operation, head)
+        if cached:
+            return cached
+
+    logging.debug(f"{remote}/HEAD is not set in {repo_path}, querying the remote")
+    show_result = run_command(
+        ["git", "remote", "show", remote], path=Path(repo_path), check=False
+    )
+    if show_result.returncode != 0:
+        logging.error(
+            f"Not able to determine default branch name for {repo_path} "
+            f"due to {show_result.stderr.strip()}"
+        )
+        return None
+
+    default_branch = None
+    for line in show_result.stdout.splitlines():
+        _, keyword, value = line.partition(f"{config.HEAD_BRANCH_KEYWORD}:")
+        if keyword:
+            default_branch = value.strip() or None
+            break
+    if head and default_branch:
+        disk_cache.set(repo_path, cache_operation, head, default_branch)
+    return default_branch
+
+
+def _classify_clone_line(line: str) -> str:
+    for needle, kind in _CLONE_LINE_KINDS:
+        if needle in line:
+            return kind
+    lowered = line.lower()
+    if "error:" in lowered or "fatal:" in lowered:
+        return "error"
+    return "other"
+
+
+def _describe_clone(line: str) -> str:
+    repo_match = _CLONING_INTO_RE.search(line)
+    return f"Cloning: {repo_match.group(1)}" if repo_match else line
+
+
+def remove_directory(directory: Path) -> None:
+    """
+    Remove a directory tree. A missing directory is not an error.
+
+    On Linux this delegates to coreutils `rm -rf`, which unlinks the tree natively
+    instead of walking it from Python.
+
+    Raises:
+        OSError: When the directory could not be removed.
+    """
+    if sys.platform == "linux":
+        result = run_command(
+            ["rm", "-rf", "--", os.fspath(directory)], check=False, timeout=None
+        )
+        if result.returncode != 0:
+            raise OSError(result.stderr.strip() or f"rm exited with code {result.returncode}")
+        return
+
     try:
         shutil.rmtree(directory)
     except FileNotFoundError:
         pass
-    except OSError as e:
-        logging.error(f"Failed to delete: {directory} - {e}")
 
 
 class RepositoryGroup:
     def __init__(self, group_directory_path: Path):
         self.group_directory = group_directory_path
 
-    def find_local_repos(self) -> Dict[str, Path]:
+    def iter_local_repos(self) -> Iterator[Tuple[str, Path]]:
+        """Yield (relative path, absolute path) pairs as repositories are discovered."""
         logging.info("Retriving local repositories...")
-        git_repos = {}
         search_dirs = [self.group_directory]
         for search_dir in search_dirs:
             if not search_dir.is_dir():
                 logging.warning(f"Search directory does not exist: {search_dir}")
                 continue
-            for root, dirs, files in os.walk(search_dir):
-                root_path = Path(root)
-                if (root_path / ".git").is_dir():
-                    repo_path = root_path.resolve()
-                    relative_path = repo_path.relative_to(self.group_directory)
-                    git_repos[str(relative_path)] = repo_path
-                    dirs[:] = [d for d in dirs if d != ".git"]
-        return git_repos
+            for repo_path in self._scan(search_dir):
+                relative_path = repo_path.relative_to(self.group_directory)
+                yield str(relative_path), repo_path
+
+    def find_local_repos(self) -> Dict[str, Path]:
+        return dict(self.iter_local_repos())
+
+    @staticmethod
+    def _scan(directory: Path) -> Iterator[Path]:
+        """
+        Yield repositories under `directory`, without descending into them (the starting
+        directory included) or following symlinks. Paths are under the resolved root.
+        """
+        stack = [os.fspath(directory.resolve())]
+        while stack:
+            dirpath = stack.pop()
+            subdirs = []
+            is_repo = False
+            try:
+                with os.scandir(dirpath) as entries:
+                    for entry in entries:
+                        if not entry.is_dir(follow_symlinks=False):
+                            continue
+                        if entry.name == ".git":
+                            is_repo = True
+                            break
+                        subdirs.append(entry.path)
+            except OSError as e:
+                logging.warning(f"Unable to scan directory {dirpath}: {e}")
+                continue
+
+            if is_repo:
+                yield Path(dirpath)
+            else:
+                stack.extend(subdirs)
 
 
 class Repository:
@@ -138,71 +293,80 @@ class Repository:
             self._repository = Repo(self.path)
         return self._repository
 
-    def get_branches_with_commit_dates(self) -> Dict[str, int]:
+    @cached_property
+    def has_commits(self) -> bool:
+        output = run_command(
+            ["git", "rev-parse", "-q", "--verify", "HEAD"], path=self.path, check=False
+        )
+        return output.returncode == 0
+
+    def get_branches_with_commit_dates(
+        self, older_than: Optional[UnixTimestamp] = None
+    ) -> Dict[BranchName, UnixTimestamp]:
+        """
+        Map unprotected local branches to their last commit timestamp.
+
+        Protected branches are matched by exact name, so `develop/foo` is not protected.
+
+        Args:
+            older_than: Only return branches whose last commit is not newer than this
+                timestamp. Refs are listed oldest first, so parsing stops at the first
+                newer branch.
+        """
         cmd = [
             "git",
             "for-each-ref",
-            "--sort=-committerdate",
+            "--sort=committerdate",
             "--format=%(refname:short) %(committerdate:unix)",
             "refs/heads/",
         ]
-        output = run_command(cmd, path=self.path)
+
+        output = run_command(cmd, path=self.path, text=False)
         branches = {}
-        stdout = output.stdout.strip()
 
-        if not stdout:
-            logging.warning(f"No output received from git command in repository {self.path}.")
+        if not output.stdout.strip():
+            logging.debug(f"No branches found in repository {self.path}.")
             return branches
 
-        for line in stdout.splitlines():
-            parts = line.split()
-            if len(parts) < 2 or not parts[1].isdigit():
-                logging.warning(
-                    f"Unexpected format for line: '{line}' in repository {self.path}. Skipping."
-                )
-                continue
-
-            branch_name = parts[0]
+        for line in output.stdout.splitlines():
+            branch_name, _, commit_timestamp = line.rpartition(b" ")
             try:
-                commit_timestamp = int(parts[1])
-            except ValueError:
+                timestamp = int(commit_timestamp)
+                if older_than is not None and timestamp > older_than:
+                    break
+                name = branch_name.decode()
+                if name in config.PROTECTED_BRANCHES:
+                    continue
+                branches[name] = timestamp
+            except (ValueError, UnicodeDecodeError):
                 logging.warning(
-                    f"Unable to convert commit timestamp '{parts[1]}' "
-                    f"to int for branch '{branch_name}' in repository {self.path}. Skipping."
+                    f"Unexpected format for line: {line!r} in repository {self.path}. Skipping."
                 )
-                continue
-
-            branches[branch_name] = commit_timestamp
-
-        for protected_branch in config.PROTECTED_BRANCHES:
-            branches.pop(protected_branch, None)
 
         return branches
 
     def get_active_branch(self) -> str | None:
-        try:
-            return self.repository.active_branch.name
-        except (TypeError, AttributeError) as e:
-            logging.warning(f"Detached HEAD in {self.path}: {e}")
+        output = run_command(
+            ["git", "symbolic-ref", "--short", "-q", "HEAD"], path=self.path, check=False
+        )
+        active_branch = output.stdout.strip()
+        if output.returncode != 0 or not active_branch:
+            logging.warning(f"Detached HEAD in {self.path}")
             return None
+        return active_branch
 
     def has_uncommitted_files(self) -> bool:
-        return self.repository.is_dirty(untracked_files=True)
+        output = run_command(
+            ["git", "status", "--porcelain=v1", "--untracked-files=normal"], path=self.path
+        )
+        return bool(output.stdout.strip())
 
     def get_default_branch_name(self, name: str = "origin") -> str | None:
-        try:
-            show_result = self.repository.git.remote("show", name)
-            matches = re.search(r"\s*HEAD branch:\s*(.*)", show_result)
-            if matches:
-                return matches.group(1)
-        except ValueError as e:
-            logging.error(
-                f"Not able to determine default branch name for {self.path} due to {e}"
-            )
+        return _default_branch_for(os.fspath(self.path), name)
 
     def safe_checkout(self) -> bool:
         try:
-            if not getattr(self.repository.head, "is_valid", lambda: False)():
+            if not self.has_commits:
                 logging.warning(f"Repository {self.path} has no commits, skipping checkout.")
                 return False
 
@@ -221,7 +385,7 @@ class Repository:
                 self.repository.git.add(all=True)
                 self.repository.git.commit("-m", config.DEFAULT_BACKUP_COMMIT_MESSAGE)
 
-            self.repository.git.checkout(default_branch)
+            run_command(["git", "checkout", default_branch], path=self.path, timeout=None)
             logging.info(f"Checked out to {default_branch} in {self.path}")
             return True
 
@@ -229,14 +393,54 @@ class Repository:
             logging.error(f"Failed to safely checkout in {self.path}: {e}")
             return False
 
-    def delete_branch(self, branch_name, force: bool = True) -> bool:
-        try:
-            self.repository.delete_head(branch_name, force=force)
-            logging.info(f"Deleted branch: {branch_name} in {self.path}")
-            return True
-        except Exception as e:
-            logging.error(f"Not able to delete a branch {branch_name} in {self.path}: {e}")
+    def fetch(self, remote: str = "origin") -> bool:
+        output = run_command(
+            [
+                "git",
+                "-c",
+                f"http.lowSpeedLimit={config.FETCH_LOW_SPEED_LIMIT}",
+                "-c",
+                f"http.lowSpeedTime={config.FETCH_LOW_SPEED_TIME}",
+                "fetch",
+                "--prune",
+                "--quiet",
+                remote,
+            ],
+            path=self.path,
+            check=False,
+            timeout=None,
+        )
+        if output.returncode != 0:
+            logging.error(f"Not able to fetch {remote} in {self.path}: {output.stderr.strip()}")
             return False
+        logging.debug(f"Fetched {remote} in {self.path}")
+        return True
+
+    def delete_branches(self, branch_names: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Delete branches with one `git branch -D` call; return (deleted, not_deleted)."""
+        branch_names = list(branch_names)
+        if not branch_names:
+            return [], []
+
+        output = run_command(
+            ["git", "branch", "-D", *branch_names], path=self.path, check=False, timeout=None
+        )
+
+        # _GIT_ENV pins LC_ALL=C, so git's confirmation lines are always in English.
+        deleted = set()
+        for line in output.stdout.splitlines():
+            if line.startswith("Deleted branch "):
+                deleted.add(line[len("Deleted branch ") :].rsplit(" (was ", 1)[0])
+
+        for line in output.stderr.splitlines():
+            logging.error(f"Not able to delete a branch in {self.path}: {line}")
+
+        not_deleted = [name for name in branch_names if name not in deleted]
+        deleted_branches = [name for name in branch_names if name in deleted]
+        for name in deleted_branches:
+            logging.info(f"Deleted branch: {name} in {self.path}")
+
+        return deleted_branches, not_deleted
 
 
 class GitLabClient(ABC):
@@ -258,9 +462,18 @@ class GitLabRepo(GitLabClient):
     def __init__(self, group_id: str, gitlab_host: str = "gitlab.com"):
         super().__init__(group_id)
         self.gitlab_host = gitlab_host.replace("https://", "").replace("http://", "")
-        self._token = self._get_token()
-        self._headers = {"PRIVATE-TOKEN": self._token}
-        self._session = self._get_session()
+
+    @cached_property
+    def _token(self) -> str:
+        return self._get_token()
+
+    @cached_property
+    def _headers(self) -> Dict[str, str]:
+        return {"PRIVATE-TOKEN": self._token}
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        return self._get_session()
 
     def _get_token(self):
         token = os.environ.get("GITLAB_TOKEN")
@@ -274,92 +487,181 @@ class GitLabRepo(GitLabClient):
     def _get_session(self):
         session = requests.Session()
         session.headers.update(self._headers)
+        adapter = HTTPAdapter(
+            pool_maxsize=config.MAX_WORKERS,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
         return session
 
+    def _request(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] | Optional[Dict[str, bool]] = None,
+    ) -> Tuple[List[Dict], requests.Response]:
+        response = self._session.get(url, params=params)
+        if response.status_code != 200:
+            logging.error(f"Error {response.status_code} while accessing {url}")
+            raise GitLabAPIError(f"Error {response.status_code} while accessing {url}")
+
+        try:
+            data = orjson.loads(response.content) if orjson else response.json()
+            if not isinstance(data, list):
+                logging.error(f"Expected list, recivied:: {type(data)}")
+                raise GitLabAPIError(f"Expected a list, received: {type(data)}")
+        except ValueError as e:
+            logging.error(f"Cannon decode JSON response from {url}: {e}")
+            raise GitLabAPIError(f"Cannon decode JSON response from {url}")
+
+        return data, response
+
+    def _get_page(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] | Optional[Dict[str, bool]],
+        page: int,
+    ) -> Tuple[List[Dict], requests.Response]:
+        current_params = params.copy() if params else {}
+        current_params.update({"page": page, "per_page": 100})
+        return self._request(url, current_params)
+
     def get_json_response(
         self,
         url: str,
         params: Optional[Dict[str, str]] | Optional[Dict[str, bool]] = None,
     ) -> List[Dict]:
-        results = []
-        page = 1
-        while True:
-            current_params = params.copy() if params else {}
-            current_params.update({"page": page, "per_page": 100})
-            response = self._session.get(url, params=current_params)
-            if response.status_code == 200:
-                try:
-                    data = response.json()
-                    if not isinstance(data, list):
-                        logging.error(f"Expected list, recivied:: {type(data)}")
-                        raise GitLabAPIError(f"Expected a list, received: {type(data)}")
-                except ValueError as e:
-                    logging.error(f"Cannon decode JSON response from {url}: {e}")
-                    raise GitLabAPIError(f"Cannon decode JSON response from {url}")
-
-                if not data:
-                    break
-
+        results, response = self._get_page(url, params, 1)
+        total_pages = int(response.headers.get("X-Total-Pages") or 0)
+
+        if total_pages > 1:
+            remaining_pages = range(2, total_pages + 1)
+            max_workers = min(config.MAX_WORKERS, len(remaining_pages))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for data, _ in executor.map(
+                    lambda page: self._get_page(url, params, page), remaining_pages
+                ):
+                    results.extend(data)
+        elif not total_pages:
+            # GitLab omits X-Total-Pages for very large collections, so follow the Link header.
+            next_url = response.links.get("next", {}).get("url")
+            while next_url:
+                data, response = self._request(next_url)
                 results.extend(data)
-                page += 1
-            else:
-                logging.error(f"Error {response.status_code} while accessing {url}")
-                raise GitLabAPIError(f"Error {response.status_code} while accessing {url}")
+                next_url = response.links.get("next", {}).get("url")
+
         return results
 
     def get_group_repositories(self) -> Dict[str, str]:
+        """
+        Map `path_with_namespace` to the HTTP clone URL for every project in the group.
+
+        Successful listings are memoized per process for GROUP_REPOSITORIES_CACHE_TTL
+        seconds, keyed by host, group and a hash of the token, so rebuilt clients reuse
+        them. At most GROUP_REPOSITORIES_CACHE_SIZE listings are kept, oldest evicted
+        first. Failures are not cached.
+        """
         url = f"https://{self.gitlab_host}/api/v4/groups/{self.group_id}/projects"
+        cache_key = (
+            self.gitlab_host,
+            str(self.group_id),
+            hashlib.sha256(self._token.encode()).hexdigest(),
+        )
+        cached = _group_repositories_cache.get(cache_key)
+        if cached is not None:
+            fetched_at, repositories = cached
+            if time.monotonic() - fetched_at < config.GROUP_REPOSITORIES_CACHE_TTL:
+                logging.debug(f"Using cached GitLab repositories for group '{self.group_id}'")
+                return dict(repositories)
+            del _group_repositories_cache[cache_key]
 
         try:
             logging.info("Retriving GitLab group repositories...")
             projects = self.get_json_response(url, params={"include_subgroups": True})
-            return {
+            repositories = {
                 project["path_with_namespace"]: project["http_url_to_repo"]
                 for project in projects
             }
+            _group_repositories_cache[cache_key] = (time.monotonic(), repositories)
+            while len(_group_repositories_cache) > config.GROUP_REPOSITORIES_CACHE_SIZE:
+                del _group_repositories_cache[next(iter(_group_repositories_cache))]
+            return dict(repositories)
         except GitLabAPIError as e:
             logging.error(f"Failed to fetch group repositories: {e}")
             return {}
 
 
 class RepoManageService:
-    def __init__(self, group_directory: Path, repositories: Optional[List[Repository]] = None):
+    def __init__(
+        self,
+        group_directory: Path,
+        repositories: Optional[List[Repository]] = None,
+        max_workers: int = config.MAX_WORKERS,
+    ):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
         self.group_directory = group_directory.resolve()
         self.group_repository = RepositoryGroup(self.group_directory)
-        self.repositories = (
-            repositories
-            if repositories
-            else [
-                Repository(repo_path)
-                for repo_path in self.group_repository.find_local_repos().values()
-            ]
-        )
+        self._repositories = repositories
+
+    def iter_repositories(self) -> Iterator[Repository]:
+        """Yield the given repositories, or discover them lazily from the group directory."""
+        if self._repositories:
+            yield from self._repositories
+            return
+        for _, repo_path in self.group_repository.iter_local_repos():
+            yield Repository(repo_path)
+
+    def _prune_one(
+        self, repository: Repository, threshold_ts: UnixTimestamp
+    ) -> Tuple[List[str], List[str], Optional[str]]:
+        abnormal_state = None
+
+        active_branch = repository.get_active_branch()
+
+        if active_branch not in config.PROTECTED_BRANCHES:
+            repository.safe_checkout()
+
+        if active_branch is None:
+            abnormal_state = " ".join(f"{repository}, {active_branch}")
+
+        branches_to_delete = repository.get_branches_with_commit_dates(threshold_ts)
+
+        deleted_branches, not_deleted_branches = repository.delete_branches(branches_to_delete)
+        deleted = [f"{repository.path} -> {branch}" for branch in deleted_branches]
+        not_deleted = [f"{repository.path} -> {branch}" for branch in not_deleted_branches]
+
+        return deleted, not_deleted, abnormal_state
 
     def prune(self) -> None:
         abnormal_state = []
         deleted = []
         not_deleted = []
 
-        for repository in self.repositories:
-            active_branch = repository.get_active_branch()
+        threshold_ts = int(time.time()) - config.DAYS_OLD_THRESHOLD * 86400
 
-            if active_branch not in config.PROTECTED_BRANCHES:
-                repository.safe_checkout()
-
-            if active_branch is None:
-                abnormal_state.append(" ".join(f"{repository}, {active_branch}"))
-
-            all_branches = repository.get_branches_with_commit_dates()
-
-            for branch_to_delete, commit_timestamp in all_branches.items():
-                repository_age = (datetime.now().timestamp() - commit_timestamp) / 86400.0
-                if repository_age < config.DAYS_OLD_THRESHOLD:
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._prune_one, repository, threshold_ts): repository
+                for repository in self.iter_repositories()
+            }
+            for future in as_completed(futures):
+                try:
+                    repo_deleted, repo_not_deleted, repo_abnormal = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to prune {futures[future].path}: {e}")
+                    abnormal_state.append(f"{futures[future].path}, {e}")
                     continue
 
-                if repository.delete_branch(branch_to_delete):
-                    deleted.append(f"{repository.path} -> {branch_to_delete}")
-                else:
-                    not_deleted.append(f"{repository.path} -> {branch_to_delete}")
+                deleted.extend(repo_deleted)
+                not_deleted.extend(repo_not_deleted)
+                if repo_abnormal:
+                    abnormal_state.append(repo_abnormal)
 
         print("Branch cleanup summary:")
         print(
@@ -387,6 +689,7 @@ class GitLabService:
         self.group_id = group_id
         self.group_directory = (self.base_directory / self.group_id).resolve()
         self.gitlab = gitlab
+        self.group_repository = RepositoryGroup(self.group_directory)
 
         try:
             self.group_directory.relative_to(self.base_directory)
@@ -403,17 +706,18 @@ class GitLabService:
             self.group_directory.mkdir(parents=True, exist_ok=True)
 
     @cached_property
-    def repositories(self):
+    def local_repositories(self) -> Dict[str, Path]:
         self._ensure_group_directory_exists()
-        group_repository = RepositoryGroup(self.group_directory)
         logging.info(f"Loading local repositories from: {self.group_directory}")
-        return [
-            Repository(repo_path) for repo_path in group_repository.find_local_repos().values()
-        ]
+        return self.group_repository.find_local_repos()
+
+    @cached_property
+    def repositories(self):
+        return [Repository(repo_path) for repo_path in self.local_repositories.values()]
 
     def _map_gitlab_group_repos_to_absolute_path(
         self, gitlab_repositories: Dict[str, str]
-    ) -> Set[Path]:
+    ) -> frozenset[str]:
         mapped_paths = set()
         group_prefix = f"{self.group_id}/"
 
@@ -422,29 +726,46 @@ class GitLabService:
                 local_path = path[len(group_prefix) :]
             else:
                 local_path = path
-            abs_path = (self.group_directory / Path(local_path)).resolve()
+            abs_path = os.path.normpath(os.path.join(self.group_directory, local_path))
             mapped_paths.add(abs_path)
-            logging.debug(f"Mapped GitLab path '{path}' -> Local path '{abs_path}'")
+            lazy_logging.debug(
+                "Mapped GitLab path '{}' -> Local path '{}'", lambda: path, lambda: abs_path
+            )
+
+        return frozenset(mapped_paths)
 
-        return mapped_paths
+    def _fetch_repositories(self, repo_paths: List[Path]) -> None:
+        """Update repositories that already exist locally instead of re-cloning them."""
+        logging.info(f"Fetching {len(repo_paths)} existing repositories...")
+        max_workers = min(config.MAX_WORKERS, len(repo_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(lambda repo_path: Repository(repo_path).fetch(), repo_paths)
+            )
+        failed = results.count(False)
+        logging.info(f"Fetched {len(results) - failed} repositories, {failed} failed")
 
     def _identify_repos_to_delete(
-        self, local_repositories: Dict[str, Path], mapped_gitlab_repositories: Set[Path]
-    ) -> List[Path]:
-        repos_to_delete = [
-            full_path
-            for relative_path, full_path in local_repositories.items()
-            if full_path.resolve() not in mapped_gitlab_repositories
-        ]
-        safe_repos_to_delete = []
-        for repo in repos_to_delete:
+        self, local_repositories: Dict[str, Path], mapped_gitlab_repositories: frozenset[str]
+    ) -> Dict[str, Path]:
+        """Return local repositories missing on GitLab, keyed by path relative to the group."""
+        local_paths = {
+            os.fspath(full_path): full_path for full_path in local_repositories.values()
+        }
+        orphan_paths = local_paths.keys() - mapped_gitlab_repositories
+
+        safe_repos_to_delete = {}
+        for orphan_path in sorted(orphan_paths):
+            full_path = local_paths[orphan_path]
             try:
-                repo.relative_to(self.group_directory)
-                safe_repos_to_delete.append(repo)
-                relative_path = repo.relative_to(self.group_directory)
-                logging.info(f"Repository to delete: {relative_path} (not found on GitLab)")
+                relative_path = full_path.relative_to(self.group_directory)
             except ValueError:
-                logging.warning(f"Skipping repository outside group directory: {repo}")
+                logging.warning(f"Skipping repository outside group directory: {full_path}")
+                continue
+            safe_repos_to_delete[str(relative_path)] = full_path
+            lazy_logging.debug(
+                "Repository to delete: {} (not found on GitLab)", lambda: relative_path
+            )
         if safe_repos_to_delete:
             logging.warning(
                 f"Found {len(safe_repos_to_delete)} repositories to delete "
@@ -460,9 +781,6 @@ class GitLabService:
             f"Starting sync for group '{self.group_id}' in directory: {self.group_directory}"
         )
 
-        self.clone_group_repositories()
-        self._ensure_group_directory_exists()
-
         gitlab_repositories = self.gitlab.get_group_repositories()
         logging.info(
             f"Found {len(gitlab_repositories)} repositories "
@@ -475,10 +793,18 @@ class GitLabService:
         logging.info(
             f"Mapped {len(mapped_gitlab_repositories)} GitLab repositories to local paths"
         )
-        gp = RepositoryGroup(self.group_directory)
-        local_repositories = gp.find_local_repos()
+        local_repositories = self.local_repositories
         logging.info(f"Found {len(local_repositories)} local repositories in group directory")
 
+        local_paths = {os.fspath(path) for path in local_repositories.values()}
+        existing = sorted(mapped_gitlab_repositories & local_paths)
+        missing = mapped_gitlab_repositories - local_paths
+        if existing:
+            self._fetch_repositories([Path(path) for path in existing])
+        if missing:
+            logging.info(f"{len(missing)} GitLab repositories are missing locally")
+            self.clone_group_repositories()
+
         to_delete = self._identify_repos_to_delete(
             local_repositories=local_repositories,
             mapped_gitlab_repositories=mapped_gitlab_repositories,
@@ -492,8 +818,7 @@ class GitLabService:
             )
             print(f"Working in: {self.group_directory}")
             print("=" * 80)
-            for i, directory in enumerate(to_delete, 1):
-                relative_path = directory.relative_to(self.group_directory)
+            for i, relative_path in enumerate(to_delete, 1):
                 print(f"{i:2d}. {relative_path}")
             print("=" * 80)
             print(f"Total: {len(to_delete)} repositories will be permanently removed")
@@ -526,17 +851,22 @@ class GitLabService:
             deleted_count = 0
             failed_deletions = []
 
-            for directory in to_delete:
-                try:
-                    relative_path = directory.relative_to(self.group_directory)
-                    remove_directory(directory)
+            max_workers = min(config.MAX_WORKERS, len(to_delete))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    relative_path: executor.submit(remove_directory, directory)
+                    for relative_path, directory in to_delete.items()
+                }
+
+            for relative_path, future in futures.items():
+                error = future.exception()
+                if error is None:
                     deleted_count += 1
                     logging.info(f"Successfully deleted: {relative_path}")
                     print(f"✓ Deleted: {relative_path}")
-                except Exception as e:
-                    relative_path = directory.relative_to(self.group_directory)
-                    failed_deletions.append((relative_path, str(e)))
-                    logging.error(f"Failed to delete {relative_path}: {e}")
+                else:
+                    failed_deletions.append((relative_path, str(error)))
+                    logging.error(f"Failed to delete {relative_path}: {error}")
                     print(f"✗ Failed to delete: {relative_path}")
 
             print("\nDeletion Summary:")
@@ -565,6 +895,8 @@ class GitLabService:
                 self.gitlab.group_id,
                 "-p",
                 "--paginate",
+                "--",
+                *config.CLONE_GIT_FLAGS,
             ]
             logging.info(f"Executing command: {' '.join(cmd)}")
             logging.info(f"Working directory: {self.base_directory}")
@@ -573,7 +905,10 @@ class GitLabService:
             env["GIT_TERMINAL_PROMPT"] = "0"
             env["GLAB_NO_INTERACTIVE"] = "1"
 
-            process = subprocess.Popen(
+            cloned_count = 0
+            skipped_count = 0
+            error_count = 0
+            with subprocess.Popen(
                 cmd,
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
@@ -581,64 +916,43 @@ class GitLabService:
                 cwd=self.base_directory,
                 text=True,
                 bufsize=1,
-                universal_newlines=True,
                 env=env,
-            )
-
-            cloned_count = 0
-            skipped_count = 0
-            error_count = 0
-            while True:
-                stderr_line = process.stderr.readline()
-                if stderr_line == "" and process.poll() is not None:
-                    break
-
-                if stderr_line:
+            ) as process:
+                for stderr_line in process.stderr:
                     line = stderr_line.strip()
                     if not line:
                         continue
-                    if "Cloning into" in line:
+                    kind = _classify_clone_line(line)
+                    if kind == "clone":
                         cloned_count += 1
-                        repo_match = re.search(r"Cloning into '([^']+)'", line)
-                        if repo_match:
-                            repo_name = repo_match.group(1)
-                            progress_msg = f"[{cloned_count}] Cloning: {repo_name}"
-                            logging.info(progress_msg)
-                        else:
-                            logging.info(f"[{cloned_count}] {line}")
+                        # Per-repository progress is DEBUG only; the summary reports the count.
+                        lazy_logging.debug(
+                            "[{}] {}", lambda: cloned_count, lambda: _describe_clone(line)
+                        )
 
-                    elif "already exists and is not an empty directory" in line:
+                    elif kind == "skip":
                         skipped_count += 1
-                        repo_match = re.search(r"'([^']+)'", line)
+                        repo_match = _QUOTED_RE.search(line)
                         if repo_match:
                             repo_name = repo_match.group(1)
                             logging.info(f"[SKIP] Repository already exists: {repo_name}")
                         else:
                             logging.warning(f"Repository already exists: {line}")
 
-                    elif 'Error: "exit status 128"' in line:
-                        logging.debug(f"Clone status: {line}")
+                    elif kind == "status":
+                        lazy_logging.debug("Clone status: {}", lambda: line)
 
-                    elif (
-                        "remote:" in line
-                        or "Receiving objects:" in line
-                        or "Resolving deltas:" in line
-                    ):
-                        logging.debug(f"Git progress: {line}")
+                    elif kind == "progress":
+                        lazy_logging.debug("Git progress: {}", lambda: line)
 
-                    elif "error:" in line.lower() or "fatal:" in line.lower():
+                    elif kind == "error":
                         error_count += 1
                         logging.error(f"Clone error: {line}")
 
                     else:
-                        logging.debug(f"Clone output: {line}")
-            stdout_output = ""
-            if process.stdout:
-                stdout_output = process.stdout.read()
+                        lazy_logging.debug("Clone output: {}", lambda: line)
 
-            if stdout_output:
-                logging.info(f"Additional output: {stdout_output}")
-            return_code = process.wait()
+                return_code = process.wait()
 
             logging.info("=" * 60)
             logging.info(f"Clone operation completed for group '{self.group_id}'!")
@@ -695,6 +1009,13 @@ def main():
         args_parser.add_argument("--cleanup", action="store_true", help="Cleanup old branches")
         args_parser.add_argument("--sync", action="store_true", help="Sync repositories")
         args_parser.add_argument("--clone", action="store_true", help="Clone group repository")
+        args_parser.add_argument(
+            "--numprocesses",
+            "-n",
+            type=int,
+            default=config.MAX_WORKERS,
+            help=f"Repositories to clean up concurrently (default: {config.MAX_WORKERS})",
+        )
         args_parser.add_argument(
             "--verbose",
             "-v",
@@ -702,6 +1023,8 @@ def main():
             help="Enable verbose (debug) logging",
         )
         parser = args_parser.parse_args()
+        if parser.numprocesses < 1:
+            args_parser.error("--numprocesses must be at least 1")
         if parser.verbose:
             from loguru import logger
 
@@ -750,7 +1073,9 @@ def main():
                 f"in directory: {group_specific_directory}"
             )
 
-            repo_service = RepoManageService(group_directory=group_specific_directory)
+            repo_service = RepoManageService(
+                group_directory=group_specific_directory, max_workers=parser.numprocesses
+            )
             repo_service.prune()
 
     except (EnvironmentError, GitLabAPIError) as e: